@@ -0,0 +1,51 @@
+#!/usr/bin/env python
+
+"""Tests for the ``converters`` module in the ``jwql`` web application.
+
+Use
+---
+
+    These tests can be run via the command line (omit the -s to
+    suppress verbose output to stdout):
+
+    ::
+
+        pytest -s test_converters.py
+"""
+
+import re
+
+import pytest
+
+from jwql.utils.constants import JWST_INSTRUMENT_NAMES_MIXEDCASE
+from jwql.website.apps.jwql.converters import InstrumentConverter
+
+
+@pytest.mark.parametrize('value', ['nircam', 'NIRCam', 'miri', 'MIRI', 'fgs', 'FGS',
+                                   'niriss', 'NIRISS', 'nirspec', 'NIRSpec'])
+def test_instrument_converter_regex_accepts(value):
+    """Assert that lowercase and mixed-case instrument names match the
+    converter's regex"""
+
+    assert re.fullmatch('(?:{})'.format(InstrumentConverter.regex), value)
+
+
+@pytest.mark.parametrize('value', ['Nircam', 'nirCam', 'foo', 'nircamx', ''])
+def test_instrument_converter_regex_rejects(value):
+    """Assert that other names do not match the converter's regex"""
+
+    assert re.fullmatch('(?:{})'.format(InstrumentConverter.regex), value) is None
+
+
+@pytest.mark.parametrize('inst, mixed', JWST_INSTRUMENT_NAMES_MIXEDCASE.items())
+def test_instrument_converter_round_trip(inst, mixed):
+    """Assert that both spellings are converted to the canonical
+    instrument name, and that ``to_url`` gives back the lowercase name
+    used in URLs"""
+
+    converter = InstrumentConverter()
+
+    assert converter.to_python(inst) == mixed
+    assert converter.to_python(mixed) == mixed
+    assert converter.to_url(converter.to_python(inst)) == inst
+    assert converter.to_python(converter.to_url(mixed)) == mixed
@@ -18,13 +18,14 @@ Use
         pytest -s test_logging_functions.py
 """
 
+import asyncio
 import logging
 import os
 import pytest
 import shutil
 
 from jwql.utils import logging_functions
-from jwql.utils.logging_functions import configure_logging, log_fail, log_info, make_log_file
+from jwql.utils.logging_functions import configure_logging, flush_logging, get_log_status, log_fail, log_info, make_log_file
 from jwql.utils.constants import ON_GITHUB_ACTIONS
 from jwql.utils.utils import get_config
 
@@ -39,6 +40,26 @@ def perform_basic_logging():
     logging.critical('This is a critical warning')
 
 
+@log_fail
+@log_info
+async def perform_async_logging(results):
+    """Performs some basic logging from a coroutine"""
+
+    await asyncio.sleep(0)
+    logging.info('This is some logging info from a coroutine')
+    results.append('done')
+
+
+@pytest.mark.skipif(ON_GITHUB_ACTIONS, reason='Requires access to central storage.')
+def test_async_logging():
+    """Assert that coroutines decorated with ``log_fail`` and
+    ``log_info`` are awaited rather than silently discarded"""
+
+    results = []
+    asyncio.run(perform_async_logging(results))
+    assert results == ['done']
+
+
 @pytest.mark.skipif(ON_GITHUB_ACTIONS, reason='Requires access to central storage.')
 def test_configure_logging():
     """Assert that the ``configure_logging`` function successfully
@@ -51,6 +72,20 @@ def test_configure_logging():
     shutil.rmtree(os.path.dirname(log_file), ignore_errors=True)
 
 
+def test_get_log_status(tmp_path):
+    """Assert that ``get_log_status`` reports the status given by the
+    last line of a log file"""
+
+    log_file = tmp_path / 'test_log.log'
+    lines = ['INFO: line {}'.format(i) for i in range(1000)]
+
+    log_file.write_text('\n'.join(lines + ['INFO: Completed Successfully']) + '\n')
+    assert get_log_status(log_file) == 'SUCCESS'
+
+    log_file.write_text('\n'.join(lines + ['INFO: Completed Successfully', 'CRITICAL: CRASHED']))
+    assert get_log_status(log_file) == 'FAILURE'
+
+
 @pytest.mark.skipif(ON_GITHUB_ACTIONS, reason='Requires access to central storage.')
 def test_make_log_file():
     """Assert that ``make_log_file`` function returns the appropriate
@@ -75,6 +110,9 @@ def test_logging_functions():
     log_file = configure_logging('test_logging_functions')
     perform_basic_logging()
 
+    # Records are written in the background, so wait for them first
+    flush_logging()
+
     # Open the log file and make some assertions
     with open(log_file, 'r') as f:
         data = f.readlines()
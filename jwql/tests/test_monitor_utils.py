@@ -25,6 +25,16 @@ from jwql.tests.resources import has_test_db
 from jwql.utils import monitor_utils
 
 
+def test_exclude_asic_tuning():
+    """Test that ASIC tuning files are removed from MAST query results"""
+    mast_results = [{'filename': 'a', 'template': 'NIRCam Dark'},
+                    {'filename': 'b', 'template': 'ISIM ASIC Tuning'},
+                    {'filename': 'c', 'template': 'NIRCam Imaging'}]
+
+    filtered = monitor_utils.exclude_asic_tuning(mast_results)
+    assert [result['filename'] for result in filtered] == ['a', 'c']
+
+
 @pytest.mark.skipif(not has_test_db(), reason='Modifies test database.')
 def test_update_monitor_table(tmp_path):
     module = 'test'
@@ -45,3 +55,29 @@ def test_update_monitor_table(tmp_path):
 
         assert session.query(Monitor).filter(
             Monitor.monitor_name == module).count() == 0
+
+
+@pytest.mark.skipif(not has_test_db(), reason='Modifies test database.')
+def test_update_monitor_table_bulk(tmp_path):
+    module = 'test_bulk'
+    start_time = datetime.datetime.now()
+    success_log = tmp_path / 'test_success_log.txt'
+    success_log.write_text('Completed Successfully')
+    failure_log = tmp_path / 'test_failure_log.txt'
+    failure_log.write_text('CRASHED')
+
+    try:
+        entries = [monitor_utils.monitor_table_entry(module, start_time, success_log),
+                   monitor_utils.monitor_table_entry(module, start_time, failure_log)]
+        monitor_utils.update_monitor_table_bulk(entries)
+        query = session.query(Monitor).filter(Monitor.monitor_name == module)
+        assert query.count() == 2
+        assert sorted(entry.status for entry in query) == ['FAILURE', 'SUCCESS']
+    finally:
+        # clean up
+        query = session.query(Monitor).filter(Monitor.monitor_name == module)
+        query.delete()
+        session.commit()
+
+        assert session.query(Monitor).filter(
+            Monitor.monitor_name == module).count() == 0
@@ -0,0 +1,65 @@
+#!/usr/bin/env python
+
+"""Tests for the ``responses`` module in the ``jwql`` web application.
+
+Use
+---
+
+    These tests can be run via the command line (omit the -s to
+    suppress verbose output to stdout):
+
+    ::
+
+        pytest -s test_responses.py
+"""
+
+import datetime
+from decimal import Decimal
+import json
+import os
+
+import pytest
+
+from jwql.utils.constants import ON_GITHUB_ACTIONS
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "jwql.website.jwql_proj.settings")
+
+from jwql.website.apps.jwql import responses  # noqa: E402 (module level import not at top of file)
+
+# Includes types that neither serializer supports natively, and a
+# non-str key
+PAYLOAD = {'date': datetime.datetime(2024, 1, 2, 3, 4, 5),
+           'value': Decimal('1.5'),
+           1: 'one',
+           'list': [1, 'two', None]}
+
+EXPECTED = {'date': '2024-01-02T03:04:05',
+            'value': '1.5',
+            '1': 'one',
+            'list': [1, 'two', None]}
+
+
+@pytest.mark.skipif(ON_GITHUB_ACTIONS, reason='Requires the django settings.')
+def test_fast_json_response_orjson():
+    """Assert that ``FastJsonResponse`` serializes the payload with
+    ``orjson``"""
+
+    pytest.importorskip('orjson')
+
+    response = responses.FastJsonResponse(PAYLOAD)
+
+    assert response['Content-Type'] == 'application/json'
+    assert json.loads(response.content) == EXPECTED
+
+
+@pytest.mark.skipif(ON_GITHUB_ACTIONS, reason='Requires the django settings.')
+def test_fast_json_response_fallback(monkeypatch):
+    """Assert that ``FastJsonResponse`` gives the same JSON with the
+    standard library ``json`` module when ``orjson`` is not installed"""
+
+    monkeypatch.setattr(responses, 'orjson', None)
+
+    response = responses.FastJsonResponse(PAYLOAD)
+
+    assert response['Content-Type'] == 'application/json'
+    assert json.loads(response.content) == EXPECTED
@@ -1023,6 +1023,10 @@ URL_DICT = {
     "nircam": "https://jwst-docs.stsci.edu/jwst-near-infrared-camera",
 }
 
+# Number of seconds that responses from slowly-changing web app views
+# are cached for
+VIEW_CACHE_TIMEOUT = 60 * 5
+
 # Possible suffix types for WFS&C files
 WFSC_SUFFIX_TYPES = ["wfscmb"]
 
@@ -53,16 +53,24 @@ References
     Quicklook automation platform.
 """
 
+import atexit
 import datetime
 import getpass
+import gzip
 import importlib
+import importlib.metadata
+import inspect
 import logging
 import logging.config
+import logging.handlers
 import os
 import pwd
+import queue
+import shutil
 import socket
 import subprocess
 import sys
+import threading
 import time
 import traceback
 
@@ -71,11 +79,27 @@ if sys.version_info < (3, 11):
 else:
     import tomllib
 
-from functools import wraps
+from functools import lru_cache, wraps
 
 from jwql.utils.permissions import set_permissions
 from jwql.utils.utils import get_config, ensure_dir_exists
 
+# The host running the process does not change during its lifetime, so
+# it is looked up once
+_HOSTNAME = socket.gethostname()
+
+# The ``conda`` environment does not change during the lifetime of a
+# process, so it is exported once and reused by every ``log_info`` call
+_ENV_SNAPSHOT = None
+_ENV_SNAPSHOT_LOCK = threading.Lock()
+
+# Filters created by ``filter_maker``, keyed by level name
+_MAX_LEVEL_FILTERS = {}
+
+# Background listener that owns the configured handlers, so that logging
+# calls only enqueue records instead of blocking on file I/O
+_LISTENER = None
+
 
 def filter_maker(level):
     """
@@ -94,12 +118,29 @@ def filter_maker(level):
     that returns false for anything with a level above WARNING, so that STDOUT won't
     duplicate those messages.
     """
-    level = getattr(logging, level)
+    if level not in _MAX_LEVEL_FILTERS:
+        _MAX_LEVEL_FILTERS[level] = _MaxLevelFilter(getattr(logging, level))
+
+    return _MAX_LEVEL_FILTERS[level]
+
+
+class _MaxLevelFilter(logging.Filter):
+    """Logging filter that only passes records at or below a given
+    level. Instances are created through ``filter_maker``.
+
+    Parameters
+    ----------
+    level : int
+        The highest log level (e.g. ``logging.WARNING``) to pass
+    """
+    __slots__ = ('level',)
 
-    def filter(record):
-        return record.levelno <= level
+    def __init__(self, level):
+        super().__init__()
+        self.level = level
 
-    return filter
+    def filter(self, record):
+        return record.levelno <= self.level
 
 
 def configure_logging(module):
@@ -128,6 +169,10 @@ def configure_logging(module):
         The path to the file where the log is written to.
     """
 
+    # Stop any listener left over from a previous configuration before
+    # its handlers are closed by the new configuration
+    _stop_queue_listener()
+
     # Determine log file location
     log_file = make_log_file(module)
 
@@ -139,12 +184,284 @@ def configure_logging(module):
 
     # Configure the logging system and set permissions for the file
     logging.config.dictConfig(logging_config)
+    _start_queue_listener()
     print('Log file initialized to {}'.format(log_file))
     set_permissions(log_file)
 
     return log_file
 
 
+def flush_logging():
+    """Block until every log record emitted so far has been written out.
+
+    Records are written by a background thread, so this should be
+    called before reading the log file of the running process.
+    """
+    _flush_queue_listener()
+
+
+def _start_queue_listener():
+    """Move the handlers of the root logger onto a ``QueueListener``
+    running in a background thread, and replace them with a single
+    ``QueueHandler`` feeding that listener.
+    """
+    global _LISTENER
+
+    root = logging.getLogger()
+    handlers = root.handlers[:]
+    for handler in handlers:
+        root.removeHandler(handler)
+
+    log_queue = queue.Queue(-1)
+
+    # Buffer records destined for the log file so that they are written
+    # in batches while records are queued up, rather than with one write
+    # per record
+    handlers = [_buffer_file_handler(handler, log_queue) for handler in handlers]
+
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+    _LISTENER = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _LISTENER.start()
+
+
+def _buffer_file_handler(handler, log_queue):
+    """Wrap ``handler`` in a ``_QueueBufferHandler`` if it writes to a
+    file.
+
+    Rotating file handlers are also set up to gzip the files that they
+    rotate out.
+
+    Parameters
+    ----------
+    handler : logging.Handler
+        The handler to (possibly) wrap
+    log_queue : queue.Queue
+        The queue that the listener reads records from
+
+    Returns
+    -------
+    handler : logging.Handler
+        A ``_QueueBufferHandler`` targeting ``handler`` if it is a
+        ``FileHandler``, otherwise ``handler`` itself
+    """
+    if isinstance(handler, logging.handlers.BaseRotatingHandler):
+        handler.namer = _gzip_namer
+        handler.rotator = _gzip_rotator
+
+    if isinstance(handler, logging.FileHandler):
+        handler = _QueueBufferHandler(log_queue, capacity=1024, flushLevel=logging.ERROR,
+                                      target=handler, flushOnClose=True)
+    return handler
+
+
+class _QueueBufferHandler(logging.handlers.MemoryHandler):
+    """``MemoryHandler`` that also flushes whenever the listener's queue
+    is empty. Records are therefore only held back while more of them
+    are waiting to be written, and a quiet process never has records
+    sitting in memory.
+
+    Parameters
+    ----------
+    log_queue : queue.Queue
+        The queue that the listener reads records from
+    **kwargs
+        Keyword arguments passed to ``MemoryHandler``
+    """
+
+    def __init__(self, log_queue, **kwargs):
+        super().__init__(**kwargs)
+        self.log_queue = log_queue
+
+    def shouldFlush(self, record):
+        return super().shouldFlush(record) or self.log_queue.empty()
+
+
+def _gzip_namer(name):
+    """Name rotated log files with a ``.gz`` extension.
+
+    Parameters
+    ----------
+    name : str
+        The default name of the rotated log file
+
+    Returns
+    -------
+    name : str
+        ``name`` with ``.gz`` appended
+    """
+    return name + '.gz'
+
+
+def _gzip_rotator(source, dest):
+    """Compress the log file being rotated out into ``dest``, and empty
+    ``source`` so that logging continues in a fresh file.
+
+    Both files are given the standard ``jwql`` permissions, which
+    ``configure_logging`` otherwise only sets on the original log file.
+
+    Parameters
+    ----------
+    source : str
+        The path to the log file being rotated
+    dest : str
+        The path to the compressed file to create
+    """
+    with open(source, 'rb') as f_in, gzip.open(dest, 'wb') as f_out:
+        shutil.copyfileobj(f_in, f_out)
+    set_permissions(dest)
+
+    # Truncate rather than remove the file, so the handler reopens a
+    # file that already exists, and set its permissions
+    open(source, 'wb').close()
+    set_permissions(source)
+
+
+def _flush_buffered_handlers():
+    """Write out any records held by the listener's buffered handlers."""
+    for handler in _LISTENER.handlers:
+        if isinstance(handler, logging.handlers.MemoryHandler):
+            handler.flush()
+
+
+def _stop_queue_listener():
+    """Process any queued log records and stop the background listener,
+    if one is running.
+    """
+    global _LISTENER
+
+    if _LISTENER is not None:
+        _LISTENER.stop()
+        _flush_buffered_handlers()
+        _LISTENER = None
+
+
+def _flush_queue_listener():
+    """Block until all queued log records have been written out."""
+    if _LISTENER is not None:
+        _LISTENER.stop()
+        _flush_buffered_handlers()
+        _LISTENER.start()
+
+
+def _reset_handlers_in_child():
+    """Give forked processes (e.g. ``multiprocessing`` workers) the
+    listener's handlers directly, since the listener thread itself is
+    not carried over into the child.
+    """
+    global _LISTENER
+
+    if _LISTENER is not None:
+        root = logging.getLogger()
+        for handler in root.handlers[:]:
+            root.removeHandler(handler)
+        for handler in _LISTENER.handlers:
+            if isinstance(handler, logging.handlers.MemoryHandler):
+                # Records buffered by the parent are the parent's to write
+                handler.buffer.clear()
+                handler = handler.target
+            root.addHandler(handler)
+        _LISTENER = None
+
+
+atexit.register(_stop_queue_listener)
+os.register_at_fork(after_in_child=_reset_handlers_in_child)
+
+
+def _get_env_snapshot():
+    """Return the output of ``conda env export``, running the command
+    only on the first call and caching the result for later calls.
+
+    If ``conda`` is not available, or the export fails or times out, a
+    message saying so is cached and returned instead, so that the
+    command is not retried on every call.
+
+    Returns
+    -------
+    environment : str
+        The exported ``conda`` environment
+    """
+    global _ENV_SNAPSHOT
+
+    with _ENV_SNAPSHOT_LOCK:
+        if _ENV_SNAPSHOT is None:
+            conda = shutil.which('conda')
+            try:
+                if conda is None:
+                    raise FileNotFoundError('conda executable not found')
+
+                # Bandit check B603 is ignored for this call: the argument
+                # list is fixed, no shell is used and no user input is involved
+                result = subprocess.run([conda, 'env', 'export'], capture_output=True, text=True, check=True, shell=False, timeout=30)  # nosec B603
+                _ENV_SNAPSHOT = result.stdout
+            except (FileNotFoundError, subprocess.CalledProcessError, subprocess.TimeoutExpired) as err:
+                message = 'Unable to export conda environment: {}'.format(err)
+                if isinstance(err, subprocess.CalledProcessError) and err.stderr:
+                    message += '\n' + err.stderr.strip()
+                _ENV_SNAPSHOT = message
+
+    return _ENV_SNAPSHOT
+
+
+@lru_cache(maxsize=1)
+def _user():
+    """Return the name of the user running the process. The password
+    database is only queried on the first call, and not at import, since
+    the lookup fails for users without an entry (e.g. in containers).
+
+    Returns
+    -------
+    user : str
+        The user name
+    """
+    return pwd.getpwuid(os.getuid()).pw_name
+
+
+@lru_cache(maxsize=1)
+def _required_modules():
+    """Return the names of the modules listed as dependencies in the
+    ``pyproject.toml`` file. The file is only read on the first call.
+
+    Returns
+    -------
+    module_list : tuple
+        The names of the required modules
+    """
+    # Read in pyproject.toml file to build list of required modules
+    toml_file = os.path.join(os.path.dirname(get_config()['setup_file']), 'pyproject.toml')
+    with open(toml_file, "rb") as f:
+        data = tomllib.load(f)
+
+    required_modules = data['project']['dependencies']
+
+    # Clean up the module list
+    module_list = tuple(item.strip().replace("'", "").replace(",", "").split("=")[0].split(">")[0].split("<")[0] for item in required_modules)
+
+    return module_list
+
+
+@lru_cache(maxsize=1)
+def _dependency_report():
+    """Return the version and path information of each required
+    module, formatted as log messages. The modules are only imported
+    and inspected on the first call.
+
+    Returns
+    -------
+    report : tuple
+        ``(level, message)`` pairs to be passed to ``logging.log``
+    """
+    report = []
+    for module in _required_modules():
+        try:
+            mod = importlib.import_module(module)
+            report.append((logging.INFO, module + ' Version: ' + importlib.metadata.version(module)))
+            report.append((logging.INFO, module + ' Path: ' + mod.__path__[0]))
+        except (ImportError, AttributeError, importlib.metadata.PackageNotFoundError) as err:
+            report.append((logging.WARNING, str(err)))
+
+    return tuple(report)
+
+
 def get_log_status(log_file):
     """Returns the end status of the given ``log_file`` (i.e.
     ``SUCCESS`` or ``FAILURE``)
@@ -161,9 +478,15 @@ def get_log_status(log_file):
         file (i.e. ``SUCCESS`` or ``FAILURE``)
     """
 
-    with open(log_file, 'r') as f:
-        data = f.readlines()
-    last_line = data[-1].strip()
+    # Make sure all pending records have been written to the file
+    flush_logging()
+
+    # Only read the end of the file, which contains the last line
+    with open(log_file, 'rb') as f:
+        f.seek(0, os.SEEK_END)
+        f.seek(max(0, f.tell() - 4096))
+        tail = f.read().decode('utf-8', 'replace')
+    last_line = tail.rstrip().rsplit('\n', 1)[-1].strip()
 
     if 'Completed Successfully' in last_line:
         return 'SUCCESS'
@@ -196,24 +519,24 @@ def make_log_file(module):
 
     # Build filename
     timestamp = datetime.datetime.now().strftime('%Y-%m-%d-%H-%M')
-    hostname = socket.gethostname()
-    filename = '{0}_{1}_{2}.log'.format(module, hostname, timestamp)
+    filename = '{0}_{1}_{2}.log'.format(module, _HOSTNAME, timestamp)
 
     # Determine save location
-    user = pwd.getpwuid(os.getuid()).pw_name
-    admin_account = get_config()['admin_account']
-    log_path = get_config()['log_dir']
+    config = get_config()
+    admin_account = config['admin_account']
+    log_path = config['log_dir']
+    user = _user()
 
     # For production
-    if user == admin_account and socket.gethostname()[0] == 'p':
+    if user == admin_account and _HOSTNAME[0] == 'p':
         log_file = os.path.join(log_path, 'ops', module, filename)
 
     # For test
-    elif user == admin_account and socket.gethostname()[0] == 't':
+    elif user == admin_account and _HOSTNAME[0] == 't':
         log_file = os.path.join(log_path, 'test', module, filename)
 
     # For dev
-    elif user == admin_account and socket.gethostname()[0] == 'd':
+    elif user == admin_account and _HOSTNAME[0] == 'd':
         log_file = os.path.join(log_path, 'dev', module, filename)
 
     # For local (also write to dev)
@@ -226,12 +549,56 @@ def make_log_file(module):
     return log_file
 
 
+def _log_environment():
+    """Log the user, system, and software environment information
+    reported by ``log_info``.
+    """
+    # Log environment information
+    logging.info('User: ' + getpass.getuser())
+    logging.info('System: ' + _HOSTNAME)
+    logging.info('Python Version: ' + sys.version.replace('\n', ''))
+    logging.info('Python Executable Path: ' + sys.executable)
+    logging.info('Running as PID {}'.format(os.getpid()))
+
+    # Log common module version information
+    for level, message in _dependency_report():
+        logging.log(level, message)
+
+    try:
+        environment = _get_env_snapshot()
+        logging.info('Environment:')
+        for line in environment.split('\n'):
+            logging.info(line)
+    except Exception as err:   # catch any exception and report the entire traceback
+        logging.exception(err)
+
+
+def _log_elapsed_time(real_time, cpu_time, func_name=None):
+    """Log the real and CPU time taken by a decorated function.
+
+    Parameters
+    ----------
+    real_time : int
+        Elapsed real (wall clock) time, in nanoseconds
+    cpu_time : int
+        Elapsed CPU time, in nanoseconds
+    func_name : str, optional
+        If given, the name of the function is included in the messages
+    """
+    label = '' if func_name is None else ' of {}'.format(func_name)
+
+    # Times are logged in H:MM:SS format, truncated to whole seconds
+    logging.info('Elapsed Real Time%s: %s', label, datetime.timedelta(seconds=real_time // 1_000_000_000))
+    logging.info('Elapsed CPU Time%s: %s', label, datetime.timedelta(seconds=cpu_time // 1_000_000_000))
+
+
 def log_info(func):
     """Decorator to log useful system information.
 
     This function can be used as a decorator to log user environment
     and system information. Future packages we want to track can be
-    added or removed as necessary.
+    added or removed as necessary. Both regular and ``async``
+    functions can be decorated.
 
     Parameters
     ----------
@@ -244,64 +611,44 @@ def log_info(func):
         The wrapped function.
     """
 
-    @wraps(func)
-    def wrapped(*args, **kwargs):
+    if inspect.iscoroutinefunction(func):
 
-        # Log environment information
-        logging.info('User: ' + getpass.getuser())
-        logging.info('System: ' + socket.gethostname())
-        logging.info('Python Version: ' + sys.version.replace('\n', ''))
-        logging.info('Python Executable Path: ' + sys.executable)
-        logging.info('Running as PID {}'.format(os.getpid()))
+        @wraps(func)
+        async def wrapped(*args, **kwargs):
 
-        # Read in setup.py file to build list of required modules
-        toml_file = os.path.join(os.path.dirname(get_config()['setup_file']), 'pyproject.toml')
-        with open(toml_file, "rb") as f:
-            data = tomllib.load(f)
+            _log_environment()
 
-        required_modules = data['project']['dependencies']
+            # Await the coroutine and time it
+            t1_cpu = time.process_time_ns()
+            t1_time = time.perf_counter_ns()
+            await func(*args, **kwargs)
+            t2_cpu = time.process_time_ns()
+            t2_time = time.perf_counter_ns()
 
-        # Clean up the module list
-        module_list = [item.strip().replace("'", "").replace(",", "").split("=")[0].split(">")[0].split("<")[0] for item in required_modules]
+            _log_elapsed_time(t2_time - t1_time, t2_cpu - t1_cpu)
 
-        # Log common module version information
-        for module in module_list:
-            try:
-                mod = importlib.import_module(module)
-                logging.info(module + ' Version: ' + importlib.metadata.version(module))
-                logging.info(module + ' Path: ' + mod.__path__[0])
-            except (ImportError, AttributeError) as err:
-                logging.warning(err)
+        return wrapped
 
-        # nosec comment added to ignore bandit security check
-        try:
-            environment = subprocess.check_output('conda env export', universal_newlines=True, shell=True)  # nosec
-            logging.info('Environment:')
-            for line in environment.split('\n'):
-                logging.info(line)
-        except Exception as err:   # catch any exception and report the entire traceback
-            logging.exception(err)
+    @wraps(func)
+    def wrapped(*args, **kwargs):
+
+        _log_environment()
 
         # Call the function and time it
-        t1_cpu = time.perf_counter()
-        t1_time = time.time()
+        t1_cpu = time.process_time_ns()
+        t1_time = time.perf_counter_ns()
         func(*args, **kwargs)
-        t2_cpu = time.perf_counter()
-        t2_time = time.time()
+        t2_cpu = time.process_time_ns()
+        t2_time = time.perf_counter_ns()
 
-        # Log execution time
-        hours_cpu, remainder_cpu = divmod(t2_cpu - t1_cpu, 60 * 60)
-        minutes_cpu, seconds_cpu = divmod(remainder_cpu, 60)
-        hours_time, remainder_time = divmod(t2_time - t1_time, 60 * 60)
-        minutes_time, seconds_time = divmod(remainder_time, 60)
-        logging.info('Elapsed Real Time: {}:{}:{}'.format(int(hours_time), int(minutes_time), int(seconds_time)))
-        logging.info('Elapsed CPU Time: {}:{}:{}'.format(int(hours_cpu), int(minutes_cpu), int(seconds_cpu)))
+        _log_elapsed_time(t2_time - t1_time, t2_cpu - t1_cpu)
 
     return wrapped
 
 
 def log_fail(func):
-    """Decorator to log crashes in the decorated code.
+    """Decorator to log crashes in the decorated code. Both regular
+    and ``async`` functions can be decorated.
 
     Parameters
     ----------
@@ -314,6 +661,23 @@ def log_fail(func):
         The wrapped function.
     """
 
+    if inspect.iscoroutinefunction(func):
+
+        @wraps(func)
+        async def wrapped(*args, **kwargs):
+
+            try:
+
+                # Run the coroutine
+                await func(*args, **kwargs)
+                logging.info('Completed Successfully')
+
+            except Exception:
+                logging.critical(traceback.format_exc())
+                logging.critical('CRASHED')
+
+        return wrapped
+
     @wraps(func)
     def wrapped(*args, **kwargs):
 
@@ -331,7 +695,8 @@ def log_fail(func):
 
 
 def log_timing(func):
-    """Decorator to time a module or function within a code.
+    """Decorator to time a module or function within a code. Both
+    regular and ``async`` functions can be decorated.
 
     Parameters
     ----------
@@ -343,21 +708,32 @@ def log_timing(func):
     wrapped : func
         The wrapped function. Will log the time."""
 
+    if inspect.iscoroutinefunction(func):
+
+        @wraps(func)
+        async def wrapped(*args, **kwargs):
+
+            # Await the coroutine and time it
+            t1_cpu = time.process_time_ns()
+            t1_time = time.perf_counter_ns()
+            await func(*args, **kwargs)
+            t2_cpu = time.process_time_ns()
+            t2_time = time.perf_counter_ns()
+
+            _log_elapsed_time(t2_time - t1_time, t2_cpu - t1_cpu, func.__name__)
+
+        return wrapped
+
+    @wraps(func)
     def wrapped(*args, **kwargs):
 
         # Call the function and time it
-        t1_cpu = time.process_time()
-        t1_time = time.time()
+        t1_cpu = time.process_time_ns()
+        t1_time = time.perf_counter_ns()
         func(*args, **kwargs)
-        t2_cpu = time.process_time()
-        t2_time = time.time()
-
-        # Log execution time
-        hours_cpu, remainder_cpu = divmod(t2_cpu - t1_cpu, 60 * 60)
-        minutes_cpu, seconds_cpu = divmod(remainder_cpu, 60)
-        hours_time, remainder_time = divmod(t2_time - t1_time, 60 * 60)
-        minutes_time, seconds_time = divmod(remainder_time, 60)
-        logging.info('Elapsed Real Time of {}: {}:{}:{}'.format(func.__name__, int(hours_time), int(minutes_time), int(seconds_time)))
-        logging.info('Elapsed CPU Time of {}: {}:{}:{}'.format(func.__name__, int(hours_cpu), int(minutes_cpu), int(seconds_cpu)))
+        t2_cpu = time.process_time_ns()
+        t2_time = time.perf_counter_ns()
+
+        _log_elapsed_time(t2_time - t1_time, t2_cpu - t1_cpu, func.__name__)
 
     return wrapped
@@ -16,14 +16,15 @@ Use
     settings = monitor_utils.update_monitor_table('dark_monitor')
 
  """
+from concurrent.futures import ThreadPoolExecutor
 import datetime
+from operator import itemgetter
 import os
 from astroquery.mast import Mast, Observations
-import numpy as np
 from django import setup
 
 from jwql.database.database_interface import Monitor, engine
-from jwql.utils.constants import ASIC_TEMPLATES, JWST_DATAPRODUCTS, MAST_QUERY_LIMIT
+from jwql.utils.constants import ASIC_TEMPLATES, JWST_DATAPRODUCTS, JWST_INSTRUMENT_NAMES_MIXEDCASE, MAST_QUERY_LIMIT
 from jwql.utils.constants import ON_GITHUB_ACTIONS, ON_READTHEDOCS
 from jwql.utils.logging_functions import configure_logging, get_log_status
 from jwql.utils import mast_utils
@@ -33,6 +34,24 @@ from jwql.utils import mast_utils
 # a MAST query.
 Mast._portal_api_connection.PAGESIZE = MAST_QUERY_LIMIT
 
+# Set of ASIC tuning templates, for constant-time membership checks
+_ASIC_TEMPLATES_SET = frozenset(ASIC_TEMPLATES)
+
+# Correctly-cased instrument name and dark templates, keyed by the
+# lowercase instrument name
+_DARK_INSTRUMENT_MAP = {'nircam': ('NIRCam', ['NRC_DARK']),
+                        'niriss': ('NIRISS', ['NIS_DARK']),
+                        'nirspec': ('NIRSpec', ['NRS_DARK']),
+                        'fgs': ('FGS', ['FGS_DARK']),
+                        'miri': ('MIRI', ['MIR_DARKALL', 'MIR_DARKIMG', 'MIR_DARKMRS'])}
+
+# Instrument names used for TA queries, keyed by the lowercase instrument
+# name, and TA exposure types, keyed by aperture (all apertures other than
+# those listed here use the MSATA exposure types)
+_TA_INSTRUMENT_MAP = {'nirspec': 'Nirspec'}
+_TA_EXP_TYPES = {'NRS_S1600A1_SLIT': ['NRS_TASLIT', 'NRS_BOTA', 'NRS_WATA']}
+_TA_DEFAULT_EXP_TYPES = ['NRS_TACQ', 'NRS_MSATA']
+
 if not ON_GITHUB_ACTIONS and not ON_READTHEDOCS:
     # These lines are needed in order to use the Django models in a standalone
     # script (as opposed to code run as a result of a webpage request). If these
@@ -43,6 +62,86 @@ if not ON_GITHUB_ACTIONS and not ON_READTHEDOCS:
     from jwql.website.apps.jwql.models import RootFileInfo
 
 
+def _query_exp_type(instrument, aperture, start_date, end_date, readpatt, exp_type):
+    """Query MAST for files of a single exposure type
+
+    Parameters
+    ----------
+    instrument : str
+        Instrument name, as expected by ``instrument_inventory``
+
+    aperture : str
+        Detector aperture to search for
+
+    start_date : float
+        Starting date for the search in MJD
+
+    end_date : float
+        Ending date for the search in MJD
+
+    readpatt : str
+        Readout pattern to search for. If None, readout pattern will
+        not be added to the query parameters.
+
+    exp_type : str
+        Exposure type (template) to search for
+
+    Returns
+    -------
+    query_results : list
+        List of dictionaries containing the query results
+    """
+    # Create dictionary of parameters to add
+    parameters = {"date_obs_mjd": {"min": start_date, "max": end_date},
+                  "apername": aperture, "exp_type": exp_type}
+
+    if readpatt is not None:
+        parameters["readpatt"] = readpatt
+
+    query = mast_utils.instrument_inventory(instrument, dataproduct=JWST_DATAPRODUCTS,
+                                            add_filters=parameters, return_data=True, caom=False)
+    return query.get('data', [])
+
+
+def _query_exp_types(instrument, aperture, start_date, end_date, readpatt, exp_types):
+    """Query MAST for files of each of the given exposure types, using
+    one thread per exposure type, and combine the results.
+
+    Parameters
+    ----------
+    instrument : str
+        Instrument name, as expected by ``instrument_inventory``
+
+    aperture : str
+        Detector aperture to search for
+
+    start_date : float
+        Starting date for the search in MJD
+
+    end_date : float
+        Ending date for the search in MJD
+
+    readpatt : str
+        Readout pattern to search for. If None, readout pattern will
+        not be added to the query parameters.
+
+    exp_types : list
+        Exposure types (templates) to search for
+
+    Returns
+    -------
+    query_results : list
+        List of dictionaries containing the query results, in the
+        order of ``exp_types``
+    """
+    with ThreadPoolExecutor(max_workers=len(exp_types)) as executor:
+        results = executor.map(lambda exp_type: _query_exp_type(instrument, aperture, start_date, end_date,
+                                                                readpatt, exp_type), exp_types)
+        query_results = [entry for result in results for entry in result]
+
+    return query_results
+
+
 def exclude_asic_tuning(mast_results):
     """Given a list of file information from a MAST query, filter out
     files taken during ASIC tuning, which will have bad data in terms
@@ -58,10 +157,8 @@ def exclude_asic_tuning(mast_results):
     filtered_results : list
         Modified list with ASIC tuning entries removed
     """
-    filtered_results = []
-    for mast_result in mast_results:
-        if mast_result['template'] not in ASIC_TEMPLATES:
-            filtered_results.append(mast_result)
+    filtered_results = [mast_result for mast_result in mast_results
+                        if mast_result['template'] not in _ASIC_TEMPLATES_SET]
     return filtered_results
 
 
@@ -115,21 +212,7 @@ def mast_query_darks(instrument, aperture, start_date, end_date, readpatt=None):
     """
 
     # Make sure instrument is correct case
-    if instrument.lower() == 'nircam':
-        instrument = 'NIRCam'
-        dark_template = ['NRC_DARK']
-    elif instrument.lower() == 'niriss':
-        instrument = 'NIRISS'
-        dark_template = ['NIS_DARK']
-    elif instrument.lower() == 'nirspec':
-        instrument = 'NIRSpec'
-        dark_template = ['NRS_DARK']
-    elif instrument.lower() == 'fgs':
-        instrument = 'FGS'
-        dark_template = ['FGS_DARK']
-    elif instrument.lower() == 'miri':
-        instrument = 'MIRI'
-        dark_template = ['MIR_DARKALL', 'MIR_DARKIMG', 'MIR_DARKMRS']
+    instrument, dark_template = _DARK_INSTRUMENT_MAP[instrument.lower()]
 
     # instrument_inventory does not allow list inputs to
     # the added_filters input (or at least if you do provide a list, then
@@ -137,26 +220,11 @@ def mast_query_darks(instrument, aperture, start_date, end_date, readpatt=None):
     # nested list is subsequently ignored by MAST.)
     # So query once for each dark template, and combine outputs into a
     # single list.
-    query_results = []
-    for template_name in dark_template:
-
-        # Create dictionary of parameters to add
-        parameters = {"date_obs_mjd": {"min": start_date, "max": end_date},
-                      "apername": aperture, "exp_type": template_name, }
-
-        if readpatt is not None:
-            parameters["readpatt"] = readpatt
-
-        query = mast_utils.instrument_inventory(instrument, dataproduct=JWST_DATAPRODUCTS,
-                                                add_filters=parameters, return_data=True, caom=False)
-        if 'data' in query.keys():
-            if len(query['data']) > 0:
-                query_results.extend(query['data'])
+    # The queries are independent, so they are run concurrently.
+    query_results = _query_exp_types(instrument, aperture, start_date, end_date, readpatt, dark_template)
 
     # Put the file entries in chronological order
-    expstarts = [e['expstart'] for e in query_results]
-    idx = np.argsort(expstarts)
-    query_results = list(np.array(query_results)[idx])
+    query_results.sort(key=itemgetter('expstart'))
 
     return query_results
 
@@ -189,12 +257,8 @@ def mast_query_ta(instrument, aperture, start_date, end_date, readpatt=None):
     """
 
     # Make sure instrument is correct case
-    if instrument.lower() == 'nirspec':
-        instrument = 'Nirspec'
-        if aperture == 'NRS_S1600A1_SLIT':
-            exp_types = ['NRS_TASLIT', 'NRS_BOTA', 'NRS_WATA']
-        else:
-            exp_types = ['NRS_TACQ', 'NRS_MSATA']
+    instrument = _TA_INSTRUMENT_MAP[instrument.lower()]
+    exp_types = _TA_EXP_TYPES.get(aperture, _TA_DEFAULT_EXP_TYPES)
 
     # instrument_inventory does not allow list inputs to
     # the added_filters input (or at least if you do provide a list, then
@@ -202,21 +266,8 @@ def mast_query_ta(instrument, aperture, start_date, end_date, readpatt=None):
     # nested list is subsequently ignored by MAST.)
     # So query once for each exp_type, and combine outputs into a
     # single list.
-    query_results = []
-    for template_name in exp_types:
-
-        # Create dictionary of parameters to add
-        parameters = {"date_obs_mjd": {"min": start_date, "max": end_date},
-                      "apername": aperture, "exp_type": template_name}
-
-        if readpatt is not None:
-            parameters["readpatt"] = readpatt
-
-        query = mast_utils.instrument_inventory(instrument, dataproduct=JWST_DATAPRODUCTS,
-                                                add_filters=parameters, return_data=True, caom=False)
-        if 'data' in query.keys():
-            if len(query['data']) > 0:
-                query_results.extend(query['data'])
+    # The queries are independent, so they are run concurrently.
+    query_results = _query_exp_types(instrument, aperture, start_date, end_date, readpatt, exp_types)
 
     return query_results
 
@@ -243,30 +294,31 @@ def model_query_ta(instrument, aperture, start_date, end_date, readpatt=None):
     query_results : list
         List of dictionaries containing the query results
     """
-    if aperture == 'NRS_S1600A1_SLIT':
-        exp_types = ['NRS_TASLIT', 'NRS_BOTA', 'NRS_WATA']
-    else:
-        exp_types = ['NRS_TACQ', 'NRS_MSATA']
+    exp_types = _TA_EXP_TYPES.get(aperture, _TA_DEFAULT_EXP_TYPES)
 
+    # Match the case used when the rows are written (mixed-case instrument,
+    # upper-case aperture) so that exact, index-friendly lookups can be used
     filter_kwargs = {
-        'instrument__iexact': instrument,
-        'aperture__iexact': aperture,
+        'instrument': JWST_INSTRUMENT_NAMES_MIXEDCASE[instrument.lower()],
+        'aperture': aperture.upper(),
         'exp_type__in': exp_types,
         'expstart__gte': start_date,
         'expstart__lte': end_date
     }
 
     if readpatt is not None:
-        filter_kwargs['readpatt'] = readpatt
+        filter_kwargs['read_patt'] = readpatt
 
     # get file info by instrument from local model
     root_file_info = RootFileInfo.objects.filter(**filter_kwargs)
 
-    return root_file_info.values()
+    # only fetch the columns the TA monitors use, skipping the
+    # potentially large comment fields
+    return root_file_info.values('root_name', 'instrument', 'aperture', 'exp_type', 'expstart', 'read_patt')
 
 
-def update_monitor_table(module, start_time, log_file):
-    """Update the ``monitor`` database table with information about
+def monitor_table_entry(module, start_time, log_file):
+    """Build an entry for the ``monitor`` database table describing
     the instrument monitor run
 
     Parameters
@@ -277,6 +329,11 @@ def update_monitor_table(module, start_time, log_file):
         The start time of the monitor
     log_file : str
         The path to where the log file is stored
+
+    Returns
+    -------
+    new_entry : dict
+        The ``monitor`` table entry
     """
     new_entry = {}
     new_entry['monitor_name'] = module
@@ -285,5 +342,37 @@ def update_monitor_table(module, start_time, log_file):
     new_entry['status'] = get_log_status(log_file)
     new_entry['log_file'] = os.path.basename(log_file)
 
+    return new_entry
+
+
+def update_monitor_table(module, start_time, log_file):
+    """Update the ``monitor`` database table with information about
+    the instrument monitor run
+
+    Parameters
+    ----------
+    module : str
+        The module name (e.g. ``dark_monitor``)
+    start_time : datetime object
+        The start time of the monitor
+    log_file : str
+        The path to where the log file is stored
+    """
+    update_monitor_table_bulk([monitor_table_entry(module, start_time, log_file)])
+
+
+def update_monitor_table_bulk(entries):
+    """Insert several entries into the ``monitor`` database table
+    using a single transaction and ``executemany`` round trip
+
+    Parameters
+    ----------
+    entries : list
+        List of ``monitor`` table entries, e.g. as created by
+        ``monitor_table_entry``
+    """
+    if not entries:
+        return
+
     with engine.begin() as connection:
-        connection.execute(Monitor.__table__.insert(), new_entry)
+        connection.execute(Monitor.__table__.insert(), entries)
@@ -27,6 +27,7 @@ References
     - JWST TR JWST-STScI-004800, SM-12
  """
 
+from functools import lru_cache
 import getpass
 import glob
 import itertools
@@ -230,6 +231,24 @@ def get_config():
     settings : dict
         A dictionary that holds the contents of the config file.
     """
+    # The validated file is cached until it is modified. It is parsed
+    # again on each call, so that callers can safely modify the
+    # dictionary they are given.
+    return json.loads(_load_config(*_config_file_version()))
+
+
+def _config_file_version():
+    """Return the location of the ``jwql`` config file and its
+    modification time, which together identify the version of the file
+    to be read.
+
+    Returns
+    -------
+    config_file_location : str
+        The path to the config file
+    mtime_ns : int
+        The modification time of the config file, in nanoseconds
+    """
     if os.environ.get('READTHEDOCS') == 'True':
         # ReadTheDocs should use the example configuration file rather than the complete configuration file
         config_file_location = os.path.join(__location__, 'jwql', 'example_config.json')
@@ -246,19 +265,41 @@ def get_config():
                                 '(https://github.com/spacetelescope/jwql/wiki/'
                                 'Config-file) for more information.'.format(base_config))
 
+    return config_file_location, os.stat(config_file_location).st_mtime_ns
+
+
+@lru_cache(maxsize=2)
+def _load_config(config_file_location, mtime_ns):
+    """Read and validate the ``jwql`` config file. Results are cached
+    by file location and modification time.
+
+    Parameters
+    ----------
+    config_file_location : str
+        The path to the config file
+    mtime_ns : int
+        The modification time of the config file, in nanoseconds
+
+    Returns
+    -------
+    config_text : str
+        The validated JSON contents of the config file
+    """
     with open(config_file_location, 'r') as config_file_object:
-        try:
-            # Load it with JSON
-            settings = json.load(config_file_object)
-        except json.JSONDecodeError as e:
-            # Raise a more helpful error if there is a formatting problem
-            raise ValueError('Incorrectly formatted config.json file. '
-                             'Please fix JSON formatting: {}'.format(e))
+        config_text = config_file_object.read()
+
+    try:
+        # Load it with JSON
+        settings = json.loads(config_text)
+    except json.JSONDecodeError as e:
+        # Raise a more helpful error if there is a formatting problem
+        raise ValueError('Incorrectly formatted config.json file. '
+                         'Please fix JSON formatting: {}'.format(e))
 
     # Ensure the file has all the needed entries with expected data types
     _validate_config(settings)
 
-    return settings
+    return config_text
 
 
 if not ON_GITHUB_ACTIONS:
@@ -666,17 +707,38 @@ def get_base_url():
 
     If the admin account is running the code, the ``base_url`` is
     assumed to be the production URL.  If not, the ``base_url`` is
-    assumed to be local.
+    assumed to be local. The result is cached until the config file is
+    modified.
 
     Returns
     -------
     base_url : str
         The beginning part of the URL to the ``jwql`` web app
     """
+    return _base_url(*_config_file_version())
+
 
+@lru_cache(maxsize=1)
+def _base_url(config_file_location, mtime_ns):
+    """Return the beginning part of the URL to the ``jwql`` web app.
+    Results are cached by config file location and modification time.
+
+    Parameters
+    ----------
+    config_file_location : str
+        The path to the config file
+    mtime_ns : int
+        The modification time of the config file, in nanoseconds
+
+    Returns
+    -------
+    base_url : str
+        The beginning part of the URL to the ``jwql`` web app
+    """
+    config = get_config()
     username = getpass.getuser()
-    if username == get_config()['admin_account']:
-        base_url = 'https://{}.stsci.edu'.format(get_config()['server_name'])
+    if username == config['admin_account']:
+        base_url = 'https://{}.stsci.edu'.format(config['server_name'])
     else:
         base_url = 'http://127.0.0.1:8000'
 
@@ -22,6 +22,10 @@ not be the full rootname, but can be any shortened version, (e.g.
 ``jw8660000801_02101``, or ``jw8660``); using an abbreviated version
 will return all filenames associated with the rootname up to that point.
 
+Responses are cached for ``VIEW_CACHE_TIMEOUT`` seconds, except for the
+looks services, which reflect the viewed status that users set in the
+web app.
+
 Authors
 -------
 
@@ -45,7 +49,7 @@ References
         ``https://docs.djangoproject.com/en/2.0/topics/http/views/``
 """
 
-from django.http import JsonResponse
+from django.views.decorators.cache import cache_page
 
 from .data_containers import get_all_proposals
 from .data_containers import get_filenames_by_proposal
@@ -56,8 +60,11 @@ from .data_containers import get_preview_images_by_proposal
 from .data_containers import get_preview_images_by_rootname
 from .data_containers import get_thumbnails_by_proposal
 from .data_containers import get_thumbnail_by_rootname
+from .responses import FastJsonResponse
+from jwql.utils.constants import VIEW_CACHE_TIMEOUT
 
 
+@cache_page(VIEW_CACHE_TIMEOUT)
 def all_proposals(request):
     """Return a list of proposals for the mission
 
@@ -68,14 +75,15 @@ def all_proposals(request):
 
     Returns
     -------
-    JsonResponse object
+    FastJsonResponse object
         Outgoing response sent to the webpage
     """
 
     proposals = get_all_proposals()
-    return JsonResponse({'proposals': proposals}, json_dumps_params={'indent': 2})
+    return FastJsonResponse({'proposals': proposals})
 
 
+@cache_page(VIEW_CACHE_TIMEOUT)
 def filenames_by_proposal(request, proposal):
     """Return a list of filenames for the given ``proposal``
 
@@ -88,14 +96,15 @@ def filenames_by_proposal(request, proposal):
 
     Returns
     -------
-    JsonResponse object
+    FastJsonResponse object
         Outgoing response sent to the webpage
     """
 
     filenames = get_filenames_by_proposal(proposal)
-    return JsonResponse({'filenames': filenames}, json_dumps_params={'indent': 2})
+    return FastJsonResponse({'filenames': filenames})
 
 
+@cache_page(VIEW_CACHE_TIMEOUT)
 def filenames_by_rootname(request, rootname):
     """Return a list of filenames for the given ``rootname``
 
@@ -108,14 +117,15 @@ def filenames_by_rootname(request, rootname):
 
     Returns
     -------
-    JsonResponse object
+    FastJsonResponse object
         Outgoing response sent to the webpage
     """
 
     filenames = get_filenames_by_rootname(rootname)
-    return JsonResponse({'filenames': filenames}, json_dumps_params={'indent': 2})
+    return FastJsonResponse({'filenames': filenames})
 
 
+@cache_page(VIEW_CACHE_TIMEOUT)
 def instrument_proposals(request, inst):
     """Return a list of proposals for the given instrument
 
@@ -131,12 +141,12 @@ def instrument_proposals(request, inst):
 
     Returns
     -------
-    JsonResponse object
+    FastJsonResponse object
         Outgoing response sent to the webpage
     """
 
     proposals = get_instrument_proposals(inst)
-    return JsonResponse({'proposals': proposals}, json_dumps_params={'indent': 2})
+    return FastJsonResponse({'proposals': proposals})
 
 
 def instrument_looks(request, inst, status=None):
@@ -160,7 +170,7 @@ def instrument_looks(request, inst, status=None):
 
     Returns
     -------
-    JsonResponse
+    FastJsonResponse
         Outgoing response sent to the webpage, depending on return_type.
     """
     # get all observation looks from file info model
@@ -171,14 +181,14 @@ def instrument_looks(request, inst, status=None):
     if status is None:
         status = 'looks'
 
-    response = JsonResponse({'instrument': inst,
-                             'keys': keys,
-                             'type': status,
-                             status: looks},
-                            json_dumps_params={'indent': 2})
+    response = FastJsonResponse({'instrument': inst,
+                                 'keys': keys,
+                                 'type': status,
+                                 status: looks})
     return response
 
 
+@cache_page(VIEW_CACHE_TIMEOUT)
 def preview_images_by_proposal(request, proposal):
     """Return a list of available preview images in the filesystem for
     the given ``proposal``.
@@ -192,14 +202,15 @@ def preview_images_by_proposal(request, proposal):
 
     Returns
     -------
-    JsonResponse object
+    FastJsonResponse object
         Outgoing response sent to the webpage
     """
 
     preview_images = get_preview_images_by_proposal(proposal)
-    return JsonResponse({'preview_images': preview_images}, json_dumps_params={'indent': 2})
+    return FastJsonResponse({'preview_images': preview_images})
 
 
+@cache_page(VIEW_CACHE_TIMEOUT)
 def preview_images_by_rootname(request, rootname):
     """Return a list of available preview images in the filesystem for
     the given ``rootname``.
@@ -213,14 +224,15 @@ def preview_images_by_rootname(request, rootname):
 
     Returns
     -------
-    JsonResponse object
+    FastJsonResponse object
         Outgoing response sent to the webpage
     """
 
     preview_images = get_preview_images_by_rootname(rootname)
-    return JsonResponse({'preview_images': preview_images}, json_dumps_params={'indent': 2})
+    return FastJsonResponse({'preview_images': preview_images})
 
 
+@cache_page(VIEW_CACHE_TIMEOUT)
 def thumbnails_by_proposal(request, proposal):
     """Return a list of available thumbnails in the filesystem for the
     given ``proposal``.
@@ -234,14 +246,15 @@ def thumbnails_by_proposal(request, proposal):
 
     Returns
     -------
-    JsonResponse object
+    FastJsonResponse object
         Outgoing response sent to the webpage
     """
 
     thumbnails = get_thumbnails_by_proposal(proposal)
-    return JsonResponse({'thumbnails': thumbnails}, json_dumps_params={'indent': 2})
+    return FastJsonResponse({'thumbnails': thumbnails})
 
 
+@cache_page(VIEW_CACHE_TIMEOUT)
 def thumbnail_by_rootname(request, rootname):
     """Return the best available thumbnail in the filesystem for the
     given ``rootname``.
@@ -255,9 +268,9 @@ def thumbnail_by_rootname(request, rootname):
 
     Returns
     -------
-    JsonResponse object
+    FastJsonResponse object
         Outgoing response sent to the webpage
     """
 
     thumbnail = get_thumbnail_by_rootname(rootname)
-    return JsonResponse({'thumbnails': thumbnail}, json_dumps_params={'indent': 2})
+    return FastJsonResponse({'thumbnails': thumbnail})
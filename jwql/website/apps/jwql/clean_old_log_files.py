@@ -19,6 +19,7 @@ Use
 import argparse
 from datetime import datetime, timedelta
 import os
+import re
 import socket
 
 from jwql.utils.utils import get_config
@@ -27,6 +28,10 @@ HOSTNAME = socket.gethostname()
 configs = get_config()
 LOG_BASE_DIR = configs['log_dir']
 
+# Log files, including the compressed backups (e.g. ``<name>.log.1.gz``)
+# written when a rotating log file handler rolls over
+LOG_FILE_PATTERN = re.compile(r'\.log(\.\d+\.gz)?$')
+
 
 def define_options():
     """Create parser to take the time limit.
@@ -75,7 +80,7 @@ def run(time_limit=timedelta(days=14), dry_run=False):
                 # We only try to delete log files produced by the machine on which
                 # this script is running. e.g. log files produced by the test server
                 # can only be deleted by running this script on the test server.
-                if HOSTNAME in item.name and item.name[-4:] == '.log':
+                if HOSTNAME in item.name and LOG_FILE_PATTERN.search(item.name):
                     stat_result = item.stat()
                     last_modified_time = datetime.fromtimestamp(stat_result.st_mtime)
                     age = now - last_modified_time
@@ -0,0 +1,38 @@
+"""Defines custom URL path converters for the ``jwql`` app.
+
+Path converters match a part of a requested URL and convert it to the
+value passed to the view, so that views receive already-validated,
+normalized arguments.
+
+Use
+---
+    This module is used in ``urls.py`` as such:
+    ::
+
+        from django.urls import path, register_converter
+        from .converters import InstrumentConverter
+        register_converter(InstrumentConverter, 'inst')
+        urlpatterns = [path('<inst:inst>/web/path/to/view/', views.view_name, name='view_name')]
+
+References
+----------
+    For more information please see:
+        ``https://docs.djangoproject.com/en/5.0/topics/http/urls/#registering-custom-path-converters``
+"""
+
+from jwql.utils.constants import JWST_INSTRUMENT_NAMES_MIXEDCASE
+
+
+class InstrumentConverter:
+    """Match a JWST instrument name in either lowercase or its usual
+    mixed-case form (e.g. ``nircam`` or ``NIRCam``), and pass the
+    mixed-case name to the view.
+    """
+
+    regex = '|'.join('{}|{}'.format(inst, mixed) for inst, mixed in JWST_INSTRUMENT_NAMES_MIXEDCASE.items())
+
+    def to_python(self, value):
+        return JWST_INSTRUMENT_NAMES_MIXEDCASE[value.lower()]
+
+    def to_url(self, value):
+        return value.lower()
@@ -0,0 +1,17 @@
+# Generated by Django 5.0.7 on 2026-10-15 12:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jwql', '0026_alter_fgsdarkdarkcurrent_amplifier_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='rootfileinfo',
+            index=models.Index(fields=['instrument', 'aperture', 'expstart'], name='rootfileinfo_inst_ap_exp_idx'),
+        ),
+    ]
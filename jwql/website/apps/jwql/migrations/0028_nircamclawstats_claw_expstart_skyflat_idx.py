@@ -0,0 +1,17 @@
+# Generated by Django 5.0.7 on 2026-10-15 12:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jwql', '0027_rootfileinfo_rootfileinfo_inst_ap_exp_idx'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='nircamclawstats',
+            index=models.Index(fields=['-expstart_mjd', 'skyflat_filename'], name='claw_expstart_skyflat_idx'),
+        ),
+    ]
@@ -138,6 +138,9 @@ class RootFileInfo(models.Model):
     class Meta:
         app_label = 'jwql'
         ordering = ['-root_name']
+        indexes = [
+            models.Index(fields=['instrument', 'aperture', 'expstart'], name='rootfileinfo_inst_ap_exp_idx'),
+        ]
 
     def __str__(self):
         """String for representing the RootFileInfo object (in Admin site etc.)."""
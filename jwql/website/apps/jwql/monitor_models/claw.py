@@ -79,3 +79,9 @@ class NIRCamClawStats(models.Model):
         managed = True
         db_table = 'nircam_claw_stats'
         unique_together = (('id', 'entry_date'),)
+        # expstart_mjd leads this index, so it also serves plain range
+        # scans on expstart_mjd (e.g. the claw monitor's last-10-days
+        # query); a separate single-column index would be redundant
+        indexes = [
+            models.Index(fields=['-expstart_mjd', 'skyflat_filename'], name='claw_expstart_skyflat_idx'),
+        ]
@@ -28,31 +28,177 @@ Dependencies
     placed in the ``jwql`` directory.
 """
 
+from functools import lru_cache
 import os
+import time
 
-from astropy.time import Time
-from bokeh.resources import CDN, INLINE
-from django.http import HttpResponse, JsonResponse
+from django.http import HttpResponse
 from django.shortcuts import render
 from django.templatetags.static import static
-import json
-import pandas as pd
+from django.views.decorators.cache import cache_page
+from django.views.decorators.vary import vary_on_cookie
 
-from . import bokeh_containers
-from jwql.website.apps.jwql import bokeh_containers
 from jwql.website.apps.jwql.monitor_models.claw import NIRCamClawStats
-from jwql.website.apps.jwql.monitor_pages.monitor_readnoise_bokeh import ReadNoiseFigure
-from jwql.utils.constants import JWST_INSTRUMENT_NAMES_MIXEDCASE
+from jwql.website.apps.jwql.responses import FastJsonResponse
+from jwql.utils.constants import VIEW_CACHE_TIMEOUT
 from jwql.utils.utils import get_config, get_base_url
-from jwql.instrument_monitors.nirspec_monitors.ta_monitors import msata_monitor
-from jwql.instrument_monitors.nirspec_monitors.ta_monitors import wata_monitor
-from jwql.utils import monitor_utils
 
 
 CONFIG = get_config()
 FILESYSTEM_DIR = os.path.join(CONFIG['jwql_dir'], 'filesystem')
 
+# Static URLs of the claw monitor output directories. Settings are
+# already loaded when the views are imported, so these are resolved once
+# here rather than on every request.
+_BKG_OUTPUT_DIR = static(os.path.join("outputs", "claw_monitor", "backgrounds"))
+_CLAW_STACKS_DIR = static(os.path.join("outputs", "claw_monitor", "claw_stacks"))
 
+# Latest Bokeh tab components of the monitor pages, keyed by monitor and
+# instrument, along with the five-minute bucket they were made in
+_MONITOR_TABS = {}
+
+# Latest contents of the EDB telemetry monitor JSON files, keyed by path,
+# along with the modification time of the file they were read from
+_EDB_JSON = {}
+
+# Background trending plots shown on the NIRCam background monitor page
+# for each filter. These do not change, so they are built once here.
+FILTERS = ('F070W', 'F090W', 'F115W', 'F150W', 'F200W', 'F277W', 'F356W', 'F444W')
+_BKG_PLOTS, _BKG_RMS_PLOTS, _BKG_MODEL_PLOTS = [], [], []
+for _fltr in FILTERS:
+    _BKG_PLOTS.append(os.path.join(_BKG_OUTPUT_DIR, '{}_backgrounds.png'.format(_fltr)))
+    _BKG_RMS_PLOTS.append(os.path.join(_BKG_OUTPUT_DIR, '{}_backgrounds_rms.png'.format(_fltr)))
+    _BKG_MODEL_PLOTS.append(os.path.join(_BKG_OUTPUT_DIR, '{}_backgrounds_vs_models.png'.format(_fltr)))
+
+
+def _five_minute_bucket():
+    """Return the number of whole five-minute intervals since the epoch,
+    used to expire cached monitor tabs every five minutes.
+
+    Returns
+    -------
+    bucket : int
+        The current five-minute bucket
+    """
+    return int(time.time() // 300)
+
+
+def _monitor_tabs(monitor, inst, build_tabs):
+    """Return the Bokeh tab components of a monitor page for an
+    instrument, rebuilding them at most once every five minutes.
+
+    Only the latest components of each monitor and instrument are kept,
+    so expired plots do not stay in memory.
+
+    Parameters
+    ----------
+    monitor : str
+        Name of the monitor (e.g. ``dark``), used to key the cache
+    inst : str
+        Name of JWST instrument
+    build_tabs : callable
+        Function taking ``inst`` and returning the tab components
+
+    Returns
+    -------
+    tabs_components : tuple
+        The Bokeh ``script`` and ``div`` of the monitor tabs
+    """
+    bucket = _five_minute_bucket()
+    cached = _MONITOR_TABS.get((monitor, inst))
+    if cached is None or cached[0] != bucket:
+        cached = (bucket, build_tabs(inst))
+        _MONITOR_TABS[(monitor, inst)] = cached
+
+    return cached[1]
+
+
+def _hour_bucket():
+    """Return the number of whole hours since the epoch, used to expire
+    cached monitor plots once an hour.
+
+    Returns
+    -------
+    bucket : int
+        The current hour bucket
+    """
+    return int(time.time() // 3600)
+
+
+@lru_cache(maxsize=1)
+def _msata_components(bucket):
+    """Generate the MSATA monitor plot components, cached per hour.
+
+    Parameters
+    ----------
+    bucket : int
+        The hour bucket (see ``_hour_bucket``) the plots are made for
+
+    Returns
+    -------
+    components : dict
+        The Bokeh ``script`` and ``div`` of the MSATA plots
+    """
+    from jwql.instrument_monitors.nirspec_monitors.ta_monitors import msata_monitor
+
+    monitor = msata_monitor.MSATA()
+    monitor.plots_for_app()
+
+    return {'script': monitor.script,
+            'div': monitor.div}
+
+
+@lru_cache(maxsize=1)
+def _wata_components(bucket):
+    """Generate the WATA monitor plot components, cached per hour.
+
+    Parameters
+    ----------
+    bucket : int
+        The hour bucket (see ``_hour_bucket``) the plots are made for
+
+    Returns
+    -------
+    components : dict
+        The Bokeh ``script`` and ``div`` of the WATA plots
+    """
+    from jwql.instrument_monitors.nirspec_monitors.ta_monitors import wata_monitor
+
+    monitor = wata_monitor.WATA()
+    monitor.plots_for_app()
+
+    return {'script': monitor.script,
+            'div': monitor.div}
+
+
+def _read_edb_json(json_path):
+    """Return the contents of an EDB telemetry monitor JSON file.
+
+    Only the latest contents of each file are cached, and the file is
+    only read again once the monitor has rewritten it.
+
+    Parameters
+    ----------
+    json_path : str
+        Path to the JSON file
+
+    Returns
+    -------
+    data : bytes
+        The raw, UTF-8 encoded JSON contents of the file
+    """
+    mtime_ns = os.stat(json_path).st_mtime_ns
+    cached = _EDB_JSON.get(json_path)
+    if cached is None or cached[0] != mtime_ns:
+        with open(json_path, 'rb') as fp:
+            cached = (mtime_ns, fp.read())
+        _EDB_JSON[json_path] = cached
+
+    return cached[1]
+
+
+@cache_page(VIEW_CACHE_TIMEOUT)
+@vary_on_cookie
 def background_monitor(request):
     """Generate the NIRCam background monitor page
 
@@ -69,24 +215,19 @@ def background_monitor(request):
 
     template = "background_monitor.html"
 
-    # Get the background trending filters to display
-    output_dir_bkg = static(os.path.join("outputs", "claw_monitor", "backgrounds"))
-    fltrs = ['F070W', 'F090W', 'F115W', 'F150W', 'F200W', 'F277W', 'F356W', 'F444W']
-    bkg_plots = [os.path.join(output_dir_bkg, '{}_backgrounds.png'.format(fltr)) for fltr in fltrs]
-    bkg_rms_plots = [os.path.join(output_dir_bkg, '{}_backgrounds_rms.png'.format(fltr)) for fltr in fltrs]
-    bkg_model_plots = [os.path.join(output_dir_bkg, '{}_backgrounds_vs_models.png'.format(fltr)) for fltr in fltrs]
-
     context = {
         'inst': 'NIRCam',
-        'bkg_plots': bkg_plots,
-        'bkg_rms_plots': bkg_rms_plots,
-        'bkg_model_plots': bkg_model_plots
+        'bkg_plots': _BKG_PLOTS,
+        'bkg_rms_plots': _BKG_RMS_PLOTS,
+        'bkg_model_plots': _BKG_MODEL_PLOTS
     }
 
     # Return a HTTP response with the template and dictionary of variables
     return render(request, template, context)
 
 
+@cache_page(VIEW_CACHE_TIMEOUT)
+@vary_on_cookie
 def bad_pixel_monitor(request, inst):
     """Generate the bad pixel monitor page for a given instrument
 
@@ -95,7 +236,8 @@ def bad_pixel_monitor(request, inst):
     request : HttpRequest object
         Incoming request from the webpage
     inst : str
-        Name of JWST instrument
+        Name of JWST instrument, correctly capitalized by the URL
+        converter (e.g. ``NIRCam``)
 
     Returns
     -------
@@ -112,6 +254,8 @@ def bad_pixel_monitor(request, inst):
     return render(request, template, context)
 
 
+@cache_page(VIEW_CACHE_TIMEOUT)
+@vary_on_cookie
 def bias_monitor(request, inst):
     """Generate the bias monitor page for a given instrument
 
@@ -120,16 +264,14 @@ def bias_monitor(request, inst):
     request : HttpRequest object
         Incoming request from the webpage
     inst : str
-        Name of JWST instrument
+        Name of JWST instrument, correctly capitalized by the URL
+        converter (e.g. ``NIRCam``)
 
     Returns
     -------
     HttpResponse object
         Outgoing response sent to the webpage
     """
-
-    # Ensure the instrument is correctly capitalized
-    inst = JWST_INSTRUMENT_NAMES_MIXEDCASE[inst.lower()]
     template = f"{inst.lower()}_bias_plots.html"
 
     context = {
@@ -156,12 +298,21 @@ def claw_monitor(request):
 
     template = "claw_monitor.html"
 
-    # Get all recent claw stack images from the last 10 days
-    query = NIRCamClawStats.objects.filter(expstart_mjd__gte=(Time.now().mjd - 10))
-    query = query.order_by('-expstart_mjd').all().values('skyflat_filename')
-    recent_files = list(pd.unique(pd.DataFrame.from_records(query)['skyflat_filename']))
-    output_dir_claws = static(os.path.join("outputs", "claw_monitor", "claw_stacks"))
-    claw_stacks = [os.path.join(output_dir_claws, filename) for filename in recent_files]
+    # Get all recent claw stack images from the last 10 days. The Unix
+    # epoch is MJD 40587, which is precise enough for a 10 day window
+    # and much cheaper than astropy's Time.now().mjd
+    now_mjd = time.time() / 86400. + 40587.
+    query = NIRCamClawStats.objects.filter(expstart_mjd__gte=(now_mjd - 10))
+    query = query.order_by('-expstart_mjd').values_list('skyflat_filename', flat=True)
+
+    # Remove duplicate filenames in one pass while keeping the
+    # newest-first order. A SELECT DISTINCT would not help here, since
+    # the ordering column would be part of it.
+    recent_files = list(dict.fromkeys(query))
+    if not recent_files:
+        return render(request, template, {'inst': 'NIRCam', 'claw_stacks': []})
+
+    claw_stacks = [os.path.join(_CLAW_STACKS_DIR, filename) for filename in recent_files]
 
     context = {
         'inst': 'NIRCam',
@@ -172,6 +323,8 @@ def claw_monitor(request):
     return render(request, template, context)
 
 
+@cache_page(VIEW_CACHE_TIMEOUT)
+@vary_on_cookie
 def cosmic_ray_monitor(request, inst):
     """Generate the cosmic ray monitor page for a given instrument
 
@@ -180,7 +333,8 @@ def cosmic_ray_monitor(request, inst):
     request : HttpRequest object
         Incoming request from the webpage
     inst : str
-        Name of JWST instrument
+        Name of JWST instrument, correctly capitalized by the URL
+        converter (e.g. ``NIRCam``)
     Returns
     -------
     HttpResponse object
@@ -190,7 +344,9 @@ def cosmic_ray_monitor(request, inst):
     # Ensure the instrument is correctly capitalized
     inst = inst.upper()
 
-    tabs_components = bokeh_containers.cosmic_ray_monitor_tabs(inst)
+    from jwql.website.apps.jwql import bokeh_containers
+
+    tabs_components = _monitor_tabs('cosmic_ray', inst, bokeh_containers.cosmic_ray_monitor_tabs)
 
     template = "cosmic_ray_monitor.html"
 
@@ -211,7 +367,8 @@ def dark_monitor(request, inst):
     request : HttpRequest object
         Incoming request from the webpage
     inst : str
-        Name of JWST instrument
+        Name of JWST instrument, correctly capitalized by the URL
+        converter (e.g. ``NIRCam``)
 
     Returns
     -------
@@ -219,10 +376,9 @@ def dark_monitor(request, inst):
         Outgoing response sent to the webpage
     """
 
-    # Ensure the instrument is correctly capitalized
-    inst = JWST_INSTRUMENT_NAMES_MIXEDCASE[inst.lower()]
+    from jwql.website.apps.jwql import bokeh_containers
 
-    tabs_components = bokeh_containers.dark_monitor_tabs(inst)
+    tabs_components = _monitor_tabs('dark', inst, bokeh_containers.dark_monitor_tabs)
 
     template = "dark_monitor.html"
 
@@ -236,7 +392,8 @@ def dark_monitor(request, inst):
 
 
 def edb_monitor(request, inst):
-    """Generate the EDB telemetry monitor page for a given instrument
+    """Generate the EDB telemetry monitor page for a given instrument.
+    The plots themselves are loaded separately by ``edb_monitor_data``.
 
     Parameters
     ----------
@@ -244,33 +401,56 @@ def edb_monitor(request, inst):
         Incoming request from the webpage
 
     inst : str
-        Name of JWST instrument
+        Name of JWST instrument, correctly capitalized by the URL
+        converter (e.g. ``NIRCam``)
 
     Returns
     -------
     HttpResponse object
         Outgoing response sent to the webpage
     """
-    inst = inst.lower()
-    plot_dir = os.path.join(CONFIG["outputs"], "edb_telemetry_monitor", inst)
-    json_file = f'edb_{inst}_tabbed_plots.json'
-
-    # Get the json data that contains the tabbed plots
-    with open(os.path.join(plot_dir, json_file), 'r') as fp:
-        data = json.dumps(json.loads(fp.read()))
-
     template = "edb_monitor.html"
 
     context = {
-        'inst': JWST_INSTRUMENT_NAMES_MIXEDCASE[inst],
-        'json_object': data,
-        'resources': CDN.render()
+        'inst': inst,
+        'base_url': get_base_url()
     }
 
     # Return a HTTP response with the template and dictionary of variables
     return render(request, template, context)
 
 
+def edb_monitor_data(request, inst):
+    """Return the tabbed EDB telemetry plots for a given instrument as
+    Bokeh JSON
+
+    Parameters
+    ----------
+    request : HttpRequest object
+        Incoming request from the webpage
+
+    inst : str
+        Name of JWST instrument, correctly capitalized by the URL
+        converter (e.g. ``NIRCam``)
+
+    Returns
+    -------
+    HttpResponse object
+        Outgoing response containing the JSON file written by the
+        EDB telemetry monitor
+    """
+    plot_dir = os.path.join(CONFIG["outputs"], "edb_telemetry_monitor", inst.lower())
+    json_file = f'edb_{inst.lower()}_tabbed_plots.json'
+
+    # The file already contains JSON, so its bytes are sent as-is
+    json_path = os.path.join(plot_dir, json_file)
+    data = _read_edb_json(json_path)
+
+    return HttpResponse(data, content_type='application/json')
+
+
+@cache_page(VIEW_CACHE_TIMEOUT)
+@vary_on_cookie
 def readnoise_monitor(request, inst):
     """Generate the readnoise monitor page for a given instrument
 
@@ -279,19 +459,18 @@ def readnoise_monitor(request, inst):
     request : HttpRequest object
         Incoming request from the webpage
     inst : str
-        Name of JWST instrument
+        Name of JWST instrument, correctly capitalized by the URL
+        converter (e.g. ``NIRCam``)
 
     Returns
     -------
     HttpResponse object
         Outgoing response sent to the webpage
     """
-
-    # Ensure the instrument is correctly capitalized
-    inst = JWST_INSTRUMENT_NAMES_MIXEDCASE[inst.lower()]
+    from jwql.website.apps.jwql.monitor_pages.monitor_readnoise_bokeh import ReadNoiseFigure
 
     # Get the html and JS needed to render the readnoise tab plots
-    tabs_components = ReadNoiseFigure(inst).tab_components
+    tabs_components = _monitor_tabs('readnoise', inst, lambda name: ReadNoiseFigure(name).tab_components)
 
     template = "readnoise_monitor.html"
 
@@ -304,6 +483,8 @@ def readnoise_monitor(request, inst):
     return render(request, template, context)
 
 
+@cache_page(VIEW_CACHE_TIMEOUT)
+@vary_on_cookie
 def msata_monitoring(request):
     """Container for MSATA monitor
 
@@ -339,19 +520,17 @@ def msata_monitoring_ajax(request):
 
     Returns
     -------
-    JsonResponse object
+    FastJsonResponse object
         Outgoing response sent to the webpage
     """
-    # Make plots and extract visualization components
-    monitor = msata_monitor.MSATA()
-    monitor.plots_for_app()
-
-    context = {'script': monitor.script,
-               'div': monitor.div}
+    # Make plots and extract visualization components (cached for up to an hour)
+    context = _msata_components(_hour_bucket())
 
-    return JsonResponse(context, json_dumps_params={'indent': 2})
+    return FastJsonResponse(context)
 
 
+@cache_page(VIEW_CACHE_TIMEOUT)
+@vary_on_cookie
 def wata_monitoring(request):
     """Container for WATA monitor
 
@@ -387,14 +566,10 @@ def wata_monitoring_ajax(request):
 
     Returns
     -------
-    JsonResponse object
+    FastJsonResponse object
         Outgoing response sent to the webpage
     """
-    # Make plots and extract visualization components
-    monitor = wata_monitor.WATA()
-    monitor.plots_for_app()
-
-    context = {'script': monitor.script,
-               'div': monitor.div}
+    # Make plots and extract visualization components (cached for up to an hour)
+    context = _wata_components(_hour_bucket())
 
-    return JsonResponse(context, json_dumps_params={'indent': 2})
+    return FastJsonResponse(context)
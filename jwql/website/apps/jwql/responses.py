@@ -0,0 +1,54 @@
+"""Defines the ``HttpResponse`` classes shared by the ``jwql`` web app
+views.
+
+This module only depends on Django (and, optionally, ``orjson``), so
+that view modules can use it without importing anything heavier.
+
+Use
+---
+    This module is imported by the view modules as such:
+    ::
+
+        from .responses import FastJsonResponse
+        return FastJsonResponse({'key': 'value'})
+
+References
+----------
+    For more information please see:
+        ``https://docs.djangoproject.com/en/2.0/ref/request-response/``
+"""
+
+import json
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import HttpResponse
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class FastJsonResponse(HttpResponse):
+    """An ``HttpResponse`` that serializes ``data`` to compact JSON.
+
+    ``orjson`` is used for the serialization if it is installed,
+    otherwise the standard library ``json`` module is used. In both
+    cases, types that are not natively supported (e.g. ``Decimal``)
+    are handled by Django's ``DjangoJSONEncoder``.
+
+    Parameters
+    ----------
+    data : dict
+        The data to serialize
+    **kwargs
+        Additional keyword arguments passed to ``HttpResponse``
+    """
+
+    def __init__(self, data, **kwargs):
+        kwargs.setdefault('content_type', 'application/json')
+        if orjson is not None:
+            content = orjson.dumps(data, default=DjangoJSONEncoder().default, option=orjson.OPT_NON_STR_KEYS)
+        else:
+            content = json.dumps(data, cls=DjangoJSONEncoder, separators=(',', ':'))
+        super().__init__(content=content, **kwargs)
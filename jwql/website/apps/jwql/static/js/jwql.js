@@ -1030,6 +1030,29 @@ function update_archive_page(inst, base_url) {
 }
 
 
+/**
+ * Loads the tabbed plots on the EDB telemetry monitor page
+ * @param {String} inst - The instrument of interest (e.g. "nircam")
+ * @param {String} base_url - The base URL for gathering data from the AJAX view.
+ */
+function update_edb_page(inst, base_url) {
+    $.ajax({
+        url: base_url + '/ajax/' + inst + '/edb_monitor/',
+        success: function(data){
+            Bokeh.embed.embed_item(data);
+
+            // Replace loading screen
+            document.getElementById("loading").style.display = "none";
+            document.getElementById('edb_fail').style.display = "none";
+        },
+        error : function(response) {
+            document.getElementById("loading").style.display = "none";
+            document.getElementById('edb_fail').style.display = "inline-block";
+        }
+    });
+}
+
+
 /**
  * Updates various components on the MSATA page
  * @param {String} inst - The instrument of interest (e.g. "FGS")
@@ -45,10 +45,14 @@ Notes
 
 from django.urls import path
 from django.urls import re_path
+from django.urls import register_converter
 
 from . import api_views
 from . import monitor_views
 from . import views
+from .converters import InstrumentConverter
+
+register_converter(InstrumentConverter, 'inst')
 
 app_name = 'jwql'
 instruments = 'nircam|NIRCam|niriss|NIRISS|nirspec|NIRSpec|miri|MIRI|fgs|FGS'
@@ -67,12 +71,12 @@ urlpatterns = [
     path('nirspec/wata_monitor/', monitor_views.wata_monitoring, name='wata_monitor'),
 
     # Common monitor views
-    re_path(r'^(?P<inst>({}))/dark_monitor/$'.format(instruments), monitor_views.dark_monitor, name='dark_monitor'),
-    re_path(r'^(?P<inst>({}))/bad_pixel_monitor/$'.format(instruments), monitor_views.bad_pixel_monitor, name='bad_pixel_monitor'),
-    re_path(r'^(?P<inst>({}))/bias_monitor/$'.format(instruments), monitor_views.bias_monitor, name='bias_monitor'),
-    re_path(r'^(?P<inst>({}))/readnoise_monitor/$'.format(instruments), monitor_views.readnoise_monitor, name='readnoise_monitor'),
-    re_path(r'^(?P<inst>({}))/edb_monitor/$'.format(instruments), monitor_views.edb_monitor, name='edb_monitor'),
-    re_path(r'^(?P<inst>({}))/cosmic_ray_monitor/$'.format(instruments), monitor_views.cosmic_ray_monitor, name='cosmic_ray_monitor'),
+    path('<inst:inst>/dark_monitor/', monitor_views.dark_monitor, name='dark_monitor'),
+    path('<inst:inst>/bad_pixel_monitor/', monitor_views.bad_pixel_monitor, name='bad_pixel_monitor'),
+    path('<inst:inst>/bias_monitor/', monitor_views.bias_monitor, name='bias_monitor'),
+    path('<inst:inst>/readnoise_monitor/', monitor_views.readnoise_monitor, name='readnoise_monitor'),
+    path('<inst:inst>/edb_monitor/', monitor_views.edb_monitor, name='edb_monitor'),
+    path('<inst:inst>/cosmic_ray_monitor/', monitor_views.cosmic_ray_monitor, name='cosmic_ray_monitor'),
 
     # Main site views
     path('about/', views.about, name='about'),
@@ -113,6 +117,7 @@ urlpatterns = [
     re_path(r'^ajax/image_group/$', views.save_image_group_ajax, name='save_image_group_ajax'),
     re_path(r'^ajax/image_sort/$', views.save_image_sort_ajax, name='save_image_sort_ajax'),
     re_path(r'^ajax/navigate_filter/$', views.save_page_navigation_data_ajax, name='save_page_navigation_data_ajax'),
+    path('ajax/<inst:inst>/edb_monitor/', monitor_views.edb_monitor_data, name='edb_monitor_ajax'),
     re_path('ajax/nirspec/msata/', monitor_views.msata_monitoring_ajax, name='msata_ajax'),
     re_path('ajax/nirspec/wata/', monitor_views.wata_monitoring_ajax, name='wata_ajax'),
 
@@ -45,6 +45,7 @@ Dependencies
 import csv
 import datetime
 import glob
+import gzip
 import json
 import logging
 import operator
@@ -719,7 +720,10 @@ def log_view(request):
     log_dictionary = {os.path.basename(path): path for path in full_log_paths}
 
     if log_name:
-        with open(log_dictionary[log_name]) as f:
+        # Rotated-out logs are stored compressed
+        log_file = log_dictionary[log_name]
+        opener = gzip.open if log_file.endswith('.gz') else open
+        with opener(log_file, 'rt') as f:
             log_text = f.read()
     else:
         log_text = None
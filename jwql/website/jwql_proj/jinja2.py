@@ -1,7 +1,9 @@
 """Jinja2 config for ``jwql`` project.
 
 Set up Jinja2 environment and configure it to read Django ``static``
-and ``url`` tags. Define custom Jinja extensions.
+and ``url`` tags. Compiled templates are cached on disk, so that each
+server process does not need to recompile them. Define custom Jinja
+extensions.
 
 References
 ----------
@@ -19,12 +21,13 @@ from django.urls import reverse
 from django.utils import timezone
 from django.template.defaultfilters import date
 from django.contrib.staticfiles.storage import staticfiles_storage
-from jinja2 import Environment, lexer, nodes
+from jinja2 import Environment, FileSystemBytecodeCache, lexer, nodes
 from jinja2.ext import Extension
 
 
 # nosec comment added to ignore bandit security check
 def environment(**options):
+    options.setdefault('bytecode_cache', FileSystemBytecodeCache())
     env = Environment(**options)  # nosec
     env.globals.update({
         'static': staticfiles_storage.url,
@@ -49,11 +49,14 @@ if __name__ == "__main__":
         'thumbnail_filesystem': 'thumbnails'
     }
 
-    for directory in ['filesystem', 'outputs', 'preview_image_filesystem', 'thumbnail_filesystem']:
-        symlink_location = os.path.join(os.path.dirname(__file__), 'apps', 'jwql', 'static', directory_mapping[directory])
-        if not os.path.exists(symlink_location):
-            symlink_path = get_config()[directory]
-            os.symlink(symlink_path, symlink_location)
+    # Read the config file once; lexists() also skips broken symlinks,
+    # which would otherwise make os.symlink() fail
+    config = get_config()
+    static_dir = os.path.join(os.path.dirname(__file__), 'apps', 'jwql', 'static')
+    for directory, target in directory_mapping.items():
+        symlink_location = os.path.join(static_dir, target)
+        if not os.path.lexists(symlink_location):
+            os.symlink(config[directory], symlink_location)
 
     try:
         from django.core.management import execute_from_command_line